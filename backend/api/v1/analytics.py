@@ -0,0 +1,82 @@
+"""
+Analytics API endpoints.
+Streaming exports and daily aggregates of negotiation outcomes for reporting.
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.database import get_db
+from backend.core.security import require_token
+from backend.modules.analytics.outcome_export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    arrow_available,
+    export_outcomes,
+)
+from backend.modules.analytics.outcome_summary import outcome_summary_service
+
+# Exports carry debtor CPFs, so every endpoint requires a valid access token
+router = APIRouter(dependencies=[Depends(require_token)])
+
+# File extensions of the export formats
+EXPORT_EXTENSIONS = {"ndjson": "ndjson", "csv": "csv", "arrow": "arrows"}
+
+
+def _validate_range(start: date, end: date) -> None:
+    """Reject inverted date ranges."""
+    if start > end:
+        raise HTTPException(
+            status_code=400,
+            detail="A data inicial deve ser anterior ou igual à data final",
+        )
+
+
+@router.get("/outcomes/export")
+async def export_outcomes_endpoint(
+    start: date = Query(..., description="First day of the export (inclusive)"),
+    end: date = Query(..., description="Last day of the export (inclusive)"),
+    format: ExportFormat = Query("ndjson", description="ndjson, csv or arrow"),
+    chunk_size: Optional[int] = Query(None, gt=0, le=50_000),
+) -> StreamingResponse:
+    """Stream negotiation outcomes in constant memory."""
+    _validate_range(start, end)
+    if format == "arrow" and not arrow_available():
+        raise HTTPException(
+            status_code=501,
+            detail="Exportação Arrow indisponível: dependência pyarrow não instalada",
+        )
+    
+    filename = f"outcomes-{start.isoformat()}-{end.isoformat()}.{EXPORT_EXTENSIONS[format]}"
+    return StreamingResponse(
+        export_outcomes(start, end, format, chunk_size),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/outcomes/summary")
+async def get_outcome_summary(
+    start: date = Query(..., description="First day (inclusive)"),
+    end: date = Query(..., description="Last day (inclusive)"),
+    db: AsyncSession = Depends(get_db),
+) -> List[Dict[str, Any]]:
+    """Daily success rate, recovered BRL and average turns per agreement."""
+    _validate_range(start, end)
+    return await outcome_summary_service.get_daily_summary(db, start, end)
+
+
+@router.post("/outcomes/summary/rebuild")
+async def rebuild_outcome_summary(
+    start: date = Query(..., description="First day (inclusive)"),
+    end: date = Query(..., description="Last day (inclusive)"),
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
+    """Recompute the daily aggregates from raw outcomes."""
+    _validate_range(start, end)
+    days = await outcome_summary_service.rebuild_daily_summary(db, start, end)
+    return {"start": start, "end": end, "days_rebuilt": days}
\ No newline at end of file
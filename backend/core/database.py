@@ -43,10 +43,16 @@ async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         # Import all models here to ensure they are registered
-        # from backend.models import debtor, debt, conversation, message, outcome
+        from backend.models import (  # noqa: F401
+            debtor, debt, conversation, message, outcome, outcome_summary
+        )
+        from backend.models.partitioning import ensure_monthly_partitions
         
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
+        
+        # Create the time-range partitions of messages and outcomes
+        await ensure_monthly_partitions(conn, settings.partition_months_ahead)
 
 
 async def close_db():
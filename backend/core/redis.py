@@ -4,7 +4,7 @@ Handles Redis connection for caching and session management.
 """
 
 import json
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 import redis.asyncio as redis
 from redis.asyncio import Redis
@@ -95,6 +95,53 @@ class RedisCache:
         """Set expiration time for a key."""
         client = await self._get_client()
         return bool(await client.expire(key, seconds))
+    
+    async def set_hashes(
+        self,
+        hashes: Dict[str, Dict[str, Any]],
+        expire: Optional[int] = None
+    ) -> int:
+        """
+        Replace several Redis hashes atomically with optional expiration.
+        
+        Each hash is written to a temporary key and renamed over the old one
+        inside MULTI/EXEC, so readers never observe a missing or partial hash.
+        """
+        client = await self._get_client()
+        
+        async with client.pipeline(transaction=True) as pipe:
+            for key, mapping in hashes.items():
+                if not mapping:
+                    pipe.delete(key)
+                    continue
+                
+                # Serialize values to JSON if they're not strings
+                mapping = {
+                    field: value if isinstance(value, str) else json.dumps(value, default=str)
+                    for field, value in mapping.items()
+                }
+                
+                tmp_key = f"{key}:tmp"
+                pipe.delete(tmp_key)
+                pipe.hset(tmp_key, mapping=mapping)
+                if expire:
+                    pipe.expire(tmp_key, expire)
+                pipe.rename(tmp_key, key)
+            await pipe.execute()
+        
+        return len(hashes)
+    
+    async def hget_json(self, key: str, field: str) -> Optional[Any]:
+        """Get a JSON value from a Redis hash field and deserialize it."""
+        client = await self._get_client()
+        value = await client.hget(key, field)
+        if value is None:
+            return None
+        
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return value
 
 
 # Global cache instance
@@ -0,0 +1,72 @@
+"""
+Access token handling for the certobot API.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import JWTError, jwt
+
+from backend.core.logging import get_logger
+from backend.core.settings import settings
+
+logger = get_logger(__name__)
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def create_access_token(
+    subject: str,
+    expires_delta: Optional[timedelta] = None,
+) -> str:
+    """
+    Issue a signed access token.
+    
+    Args:
+        subject: Identifier of the token holder
+        expires_delta: Defaults to the configured JWT expiration
+    
+    Returns:
+        Encoded JWT
+    """
+    expires_at = datetime.now(timezone.utc) + (
+        expires_delta or timedelta(minutes=settings.jwt_expire_minutes)
+    )
+    return jwt.encode(
+        {"sub": subject, "exp": expires_at},
+        settings.jwt_secret_key,
+        algorithm=settings.jwt_algorithm,
+    )
+
+
+async def require_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> Dict[str, Any]:
+    """
+    FastAPI dependency rejecting requests without a valid bearer token.
+    
+    Returns:
+        Claims of the token
+    """
+    if credentials is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Token de acesso ausente",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    try:
+        return jwt.decode(
+            credentials.credentials,
+            settings.jwt_secret_key,
+            algorithms=[settings.jwt_algorithm],
+        )
+    except JWTError as e:
+        logger.warning("Rejected access token", error=str(e))
+        raise HTTPException(
+            status_code=401,
+            detail="Token de acesso inválido ou expirado",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
\ No newline at end of file
@@ -92,12 +92,64 @@ class Settings(BaseSettings):
     )
     max_discount_percentage: float = Field(
         default=50.0,
+        ge=0,
+        le=100,
         description="Maximum discount percentage allowed"
     )
     min_payment_amount: float = Field(
         default=10.00,
         description="Minimum payment amount in BRL"
     )
+    max_installments: int = Field(
+        default=12,
+        ge=1,
+        description="Maximum number of installments offered in a negotiation"
+    )
+    discount_tier_step_percentage: float = Field(
+        default=5.0,
+        gt=0,
+        description="Step between precomputed discount tiers in percentage points"
+    )
+    offer_grid_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 60 * 60,
+        description="Expiration time for cached negotiation offer grids in seconds"
+    )
+    
+    # Storage and Archival Configuration
+    partition_months_ahead: int = Field(
+        default=2,
+        description="Number of future monthly partitions kept ready for messages and outcomes"
+    )
+    partition_maintenance_interval_minutes: int = Field(
+        default=60,
+        description="Interval between partition maintenance runs in minutes"
+    )
+    archive_enabled: bool = Field(
+        default=True,
+        description="Run the conversation archival job in the background"
+    )
+    archive_dir: str = Field(
+        default="data/archive",
+        description="Local directory for archived conversations (NDJSON.gz)"
+    )
+    archive_after_days: int = Field(
+        default=30,
+        description="Days after a conversation closes before it is archived"
+    )
+    archive_batch_size: int = Field(
+        default=500,
+        description="Maximum conversations archived per batch"
+    )
+    archive_interval_minutes: int = Field(
+        default=60,
+        description="Interval between archival job runs in minutes"
+    )
+    
+    # Analytics Configuration
+    export_chunk_size: int = Field(
+        default=5000,
+        description="Rows fetched per server-side cursor round trip in outcome exports"
+    )
     
     @property
     def is_development(self) -> bool:
@@ -3,13 +3,18 @@ Main FastAPI application for Certobot.
 Conversational AI system for debt collection via WhatsApp in Brazilian Portuguese.
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from backend.api.v1.analytics import router as analytics_router
+from backend.core.database import close_db, init_db
 from backend.core.settings import settings
+from backend.models.partitioning import maintain_partitions_forever
+from backend.modules.archival.conversation_archiver import conversation_archiver
 
 
 @asynccontextmanager
@@ -21,10 +26,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     print(f"🔄 Redis: {settings.redis_url}")
     print(f"🌍 Language: {settings.default_language}")
     
+    # Create missing tables and the current partitions
+    await init_db()
+    
+    background_tasks = [asyncio.create_task(maintain_partitions_forever())]
+    if settings.archive_enabled:
+        print(f"🗄️ Archiving closed conversations to {settings.archive_dir}")
+        background_tasks.append(asyncio.create_task(conversation_archiver.run_forever()))
+    
     yield
     
     # Shutdown
     print("🛑 Shutting down Certobot API")
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await close_db()
 
 
 # Create FastAPI application
@@ -69,6 +87,9 @@ async def health_check():
     }
 
 
+app.include_router(analytics_router, prefix="/api/v1/analytics", tags=["Analytics"])
+
+
 # TODO: Add API routers for different modules
 # from backend.api.v1.whatsapp import router as whatsapp_router
 # from backend.api.v1.negotiation import router as negotiation_router
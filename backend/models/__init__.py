@@ -4,16 +4,18 @@ Contains all SQLAlchemy models for the application.
 """
 
 # Import all models here to ensure they are registered with SQLAlchemy
-# from .debtor import Debtor
-# from .debt import Debt
-# from .conversation import Conversation
-# from .message import Message
-# from .outcome import Outcome
+from .debtor import Debtor
+from .debt import Debt
+from .conversation import Conversation
+from .message import Message
+from .outcome import Outcome
+from .outcome_summary import OutcomeDailySummary
 
 __all__ = [
-    # "Debtor",
-    # "Debt", 
-    # "Conversation",
-    # "Message",
-    # "Outcome",
+    "Debtor",
+    "Debt",
+    "Conversation",
+    "Message",
+    "Outcome",
+    "OutcomeDailySummary",
 ]
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+Conversation model.
+Conversation sessions with status tracking.
+"""
+
+import uuid
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Uuid, func, text
+from sqlalchemy.orm import relationship
+
+from backend.core.database import Base
+
+# Statuses of conversations that are over and can be archived
+CLOSED_CONVERSATION_STATUSES = ("completed", "failed", "abandoned")
+
+
+class Conversation(Base):
+    """WhatsApp conversation session with a debtor."""
+    
+    __tablename__ = "conversations"
+    __table_args__ = (
+        # Covering index for "active conversation by phone", used on every
+        # incoming WhatsApp message without touching the heap
+        Index(
+            "ix_conversations_active_phone",
+            "phone",
+            postgresql_include=["id", "session_id", "debtor_id", "debt_id", "start_time"],
+            postgresql_where=text("status = 'active'"),
+        ),
+        # Archival job scans closed conversations oldest first
+        Index(
+            "ix_conversations_closed_end_time",
+            "end_time",
+            postgresql_where=text("status <> 'active'"),
+        ),
+    )
+    
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    session_id = Column(String(64), nullable=False, unique=True)
+    debtor_id = Column(Uuid, ForeignKey("debtors.id", ondelete="SET NULL"), nullable=True)
+    debt_id = Column(Uuid, ForeignKey("debts.id", ondelete="SET NULL"), nullable=True)
+    phone = Column(String(20), nullable=False)
+    start_time = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    end_time = Column(DateTime(timezone=True), nullable=True)
+    # active | completed | failed | abandoned
+    status = Column(String(20), nullable=False, default="active")
+    
+    messages = relationship(
+        "Message",
+        back_populates="conversation",
+        order_by="Message.created_at",
+        passive_deletes=True,
+    )
\ No newline at end of file
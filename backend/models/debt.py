@@ -0,0 +1,45 @@
+"""
+Debt model.
+Debt records linked to debtors.
+"""
+
+import uuid
+
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    String,
+    Uuid,
+    func,
+)
+from sqlalchemy.orm import relationship
+
+from backend.core.database import Base
+
+
+class Debt(Base):
+    """Outstanding debt owed by a debtor."""
+    
+    __tablename__ = "debts"
+    
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    debtor_id = Column(
+        Uuid,
+        ForeignKey("debtors.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    original_amount = Column(Numeric(12, 2), nullable=False)
+    current_amount = Column(Numeric(12, 2), nullable=False)
+    due_date = Column(Date, nullable=False)
+    days_past_due = Column(Integer, nullable=False, default=0)
+    debt_type = Column(String(50), nullable=False)
+    # active | negotiating | paid | written_off
+    status = Column(String(20), nullable=False, default="active")
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    
+    debtor = relationship("Debtor", back_populates="debts")
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""
+Debtor model.
+Primary debtor information with CPF indexing.
+"""
+
+import uuid
+
+from sqlalchemy import Column, DateTime, String, Uuid, func
+from sqlalchemy.orm import relationship
+
+from backend.core.database import Base
+
+
+class Debtor(Base):
+    """Debtor contacted by Certobot."""
+    
+    __tablename__ = "debtors"
+    
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    cpf = Column(String(11), nullable=False, unique=True, index=True)
+    name = Column(String(255), nullable=False)
+    phone = Column(String(20), nullable=False, index=True)
+    email = Column(String(255), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    
+    debts = relationship("Debt", back_populates="debtor")
\ No newline at end of file
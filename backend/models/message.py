@@ -0,0 +1,48 @@
+"""
+Message model.
+Individual messages within conversations, range partitioned by month.
+"""
+
+import uuid
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text, Uuid, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
+
+from backend.core.database import Base
+
+
+class Message(Base):
+    """
+    Single WhatsApp message exchanged in a conversation.
+    
+    The table is partitioned by range on created_at, so the partition key is
+    part of the primary key. Partitions are managed by backend.models.partitioning.
+    """
+    
+    __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_conversation_created_at", "conversation_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        server_default=func.now(),
+    )
+    conversation_id = Column(
+        Uuid,
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # system | debtor
+    sender = Column(String(10), nullable=False)
+    content = Column(Text, nullable=False)
+    # text | document | validation_request
+    message_type = Column(String(30), nullable=False, default="text")
+    message_metadata = Column("metadata", JSONB, nullable=True)
+    
+    conversation = relationship("Conversation", back_populates="messages")
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+Outcome model.
+Negotiation results and payment agreements, range partitioned by month.
+"""
+
+import uuid
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    Uuid,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from backend.core.database import Base
+
+
+class Outcome(Base):
+    """
+    Qualitative result of a negotiation conversation.
+    
+    The table is partitioned by range on interaction_timestamp, so the partition
+    key is part of the primary key. Outcomes outlive their conversation: once
+    the conversation is archived, conversation_id is cleared and session_id
+    remains as the reference.
+    """
+    
+    __tablename__ = "outcomes"
+    __table_args__ = (
+        # Covering index for "outcomes by day" reporting
+        Index(
+            "ix_outcomes_day",
+            "interaction_timestamp",
+            postgresql_include=[
+                "outcome",
+                "agreed_amount",
+                "discount_amount",
+                "duration",
+                "turns",
+            ],
+        ),
+        Index("ix_outcomes_session_id", "session_id"),
+        {"postgresql_partition_by": "RANGE (interaction_timestamp)"},
+    )
+    
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    interaction_timestamp = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        server_default=func.now(),
+    )
+    conversation_id = Column(
+        Uuid,
+        ForeignKey("conversations.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    session_id = Column(String(64), nullable=False)
+    debtor_cpf = Column(String(11), nullable=False)
+    # successful | partially_successful | unsuccessful | no_contact
+    outcome = Column(String(30), nullable=False)
+    agreed_amount = Column(Numeric(12, 2), nullable=True)
+    discount_amount = Column(Numeric(12, 2), nullable=True)
+    payment_date = Column(DateTime(timezone=True), nullable=True)
+    scheduled_payment_dates = Column(ARRAY(DateTime(timezone=True)), nullable=False, default=list)
+    payment_slip_reference = Column(String(100), nullable=True)
+    qualitative_notes = Column(Text, nullable=False)
+    # Conversation duration in seconds
+    duration = Column(Integer, nullable=False)
+    # Number of messages exchanged in the conversation
+    turns = Column(Integer, nullable=False, default=0)
+    language = Column(String(10), nullable=False, default="pt-BR")
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+Outcome summary model.
+Daily aggregates of negotiation outcomes, maintained incrementally for dashboards.
+"""
+
+from sqlalchemy import DDL, Column, Date, DateTime, Integer, Numeric, event, func
+
+from backend.core.database import Base
+from backend.core.settings import settings
+
+# Outcomes that count as an agreement for recovered amounts and turns
+AGREEMENT_OUTCOMES = ("successful", "partially_successful")
+
+
+class OutcomeDailySummary(Base):
+    """
+    Negotiation outcomes aggregated per local day.
+    
+    Rows are adjusted by triggers on every outcome insert, update and delete,
+    so dashboards read this table instead of scanning outcomes. Only additive
+    counters are stored; rates and averages are derived when reading.
+    """
+    
+    __tablename__ = "outcome_daily_summary"
+    
+    day = Column(Date, primary_key=True)
+    total_outcomes = Column(Integer, nullable=False, default=0)
+    successful = Column(Integer, nullable=False, default=0)
+    partially_successful = Column(Integer, nullable=False, default=0)
+    unsuccessful = Column(Integer, nullable=False, default=0)
+    no_contact = Column(Integer, nullable=False, default=0)
+    agreements = Column(Integer, nullable=False, default=0)
+    recovered_amount = Column(Numeric(14, 2), nullable=False, default=0)
+    agreement_turns = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    
+    @property
+    def success_rate(self) -> float:
+        """Share of outcomes that were fully successful."""
+        return self.successful / self.total_outcomes if self.total_outcomes else 0.0
+    
+    @property
+    def average_turns_per_agreement(self) -> float:
+        """Average number of messages exchanged to reach an agreement."""
+        return self.agreement_turns / self.agreements if self.agreements else 0.0
+
+
+# Triggers keeping the summary up to date. This is the only definition: it is
+# installed by init_db so the day buckets always follow DEFAULT_TIMEZONE, like
+# the rebuild and export queries.
+OUTCOME_DAILY_SUMMARY_DELTA = DDL(f"""
+CREATE OR REPLACE FUNCTION outcome_daily_summary_delta(
+    ts TIMESTAMP WITH TIME ZONE,
+    result VARCHAR,
+    agreed NUMERIC,
+    message_turns INTEGER,
+    sign INTEGER
+) RETURNS VOID AS $$
+DECLARE
+    is_agreement BOOLEAN := result IN ('successful', 'partially_successful');
+BEGIN
+    INSERT INTO outcome_daily_summary AS s (
+        day, total_outcomes, successful, partially_successful, unsuccessful,
+        no_contact, agreements, recovered_amount, agreement_turns, updated_at
+    ) VALUES (
+        (ts AT TIME ZONE '{settings.default_timezone}')::DATE,
+        sign,
+        sign * (result = 'successful')::INTEGER,
+        sign * (result = 'partially_successful')::INTEGER,
+        sign * (result = 'unsuccessful')::INTEGER,
+        sign * (result = 'no_contact')::INTEGER,
+        sign * is_agreement::INTEGER,
+        sign * CASE WHEN is_agreement THEN COALESCE(agreed, 0) ELSE 0 END,
+        sign * CASE WHEN is_agreement THEN message_turns ELSE 0 END,
+        now()
+    )
+    ON CONFLICT (day) DO UPDATE SET
+        total_outcomes = s.total_outcomes + EXCLUDED.total_outcomes,
+        successful = s.successful + EXCLUDED.successful,
+        partially_successful = s.partially_successful + EXCLUDED.partially_successful,
+        unsuccessful = s.unsuccessful + EXCLUDED.unsuccessful,
+        no_contact = s.no_contact + EXCLUDED.no_contact,
+        agreements = s.agreements + EXCLUDED.agreements,
+        recovered_amount = s.recovered_amount + EXCLUDED.recovered_amount,
+        agreement_turns = s.agreement_turns + EXCLUDED.agreement_turns,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+# Subtracts the old row and adds the new one; updates that move a row to
+# another partition reach it as a DELETE followed by an INSERT
+OUTCOME_DAILY_SUMMARY_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION outcome_daily_summary_apply() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM outcome_daily_summary_delta(
+            OLD.interaction_timestamp, OLD.outcome, OLD.agreed_amount, OLD.turns, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM outcome_daily_summary_delta(
+            NEW.interaction_timestamp, NEW.outcome, NEW.agreed_amount, NEW.turns, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+OUTCOME_DAILY_SUMMARY_TRIGGER = DDL("""
+CREATE OR REPLACE TRIGGER outcomes_daily_summary
+    AFTER INSERT OR DELETE ON outcomes
+    FOR EACH ROW EXECUTE FUNCTION outcome_daily_summary_apply()
+""")
+
+# Updates that do not touch aggregated columns (e.g. the archiver clearing
+# conversation_id) leave the summary alone
+OUTCOME_DAILY_SUMMARY_UPDATE_TRIGGER = DDL("""
+CREATE OR REPLACE TRIGGER outcomes_daily_summary_update
+    AFTER UPDATE ON outcomes
+    FOR EACH ROW
+    WHEN (
+        OLD.interaction_timestamp IS DISTINCT FROM NEW.interaction_timestamp
+        OR OLD.outcome IS DISTINCT FROM NEW.outcome
+        OR OLD.agreed_amount IS DISTINCT FROM NEW.agreed_amount
+        OR OLD.turns IS DISTINCT FROM NEW.turns
+    )
+    EXECUTE FUNCTION outcome_daily_summary_apply()
+""")
+
+for ddl in (
+    OUTCOME_DAILY_SUMMARY_DELTA,
+    OUTCOME_DAILY_SUMMARY_FUNCTION,
+    OUTCOME_DAILY_SUMMARY_TRIGGER,
+    OUTCOME_DAILY_SUMMARY_UPDATE_TRIGGER,
+):
+    event.listen(Base.metadata, "after_create", ddl)
\ No newline at end of file
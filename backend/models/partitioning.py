@@ -0,0 +1,134 @@
+"""
+Time-range partition management.
+Creates the monthly partitions of the messages and outcomes tables.
+"""
+
+import asyncio
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from backend.core.database import engine
+from backend.core.logging import get_logger
+from backend.core.settings import settings
+
+logger = get_logger("partitioning")
+
+# Partitioned tables and their partition key
+PARTITIONED_TABLES = {
+    "messages": "created_at",
+    "outcomes": "interaction_timestamp",
+}
+
+
+def month_start(day: date, offset: int = 0) -> date:
+    """First day of the month of the given date, shifted by offset months."""
+    months = day.year * 12 + day.month - 1 + offset
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Name of the monthly partition of a table (e.g. messages_2025_01)."""
+    return f"{table}_{month.year:04d}_{month.month:02d}"
+
+
+async def ensure_monthly_partitions(
+    conn: AsyncConnection,
+    months_ahead: int,
+    today: Optional[date] = None,
+) -> List[str]:
+    """
+    Create the default partition and monthly partitions from the current month
+    up to months_ahead months in the future for every partitioned table.
+    
+    Args:
+        conn: Open database connection (inside a transaction)
+        months_ahead: Number of future months to create partitions for
+        today: Reference date, defaults to today
+        
+    Returns:
+        Names of the monthly partitions created
+    """
+    today = today or date.today()
+    created = []
+    
+    for table, key in PARTITIONED_TABLES.items():
+        await conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+        ))
+        
+        for offset in range(months_ahead + 1):
+            start = month_start(today, offset)
+            end = month_start(today, offset + 1)
+            name = partition_name(table, start)
+            
+            exists = await conn.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name})
+            if exists.scalar():
+                continue
+            
+            await _create_partition(conn, table, key, name, start, end)
+            created.append(name)
+    
+    return created
+
+
+async def _create_partition(
+    conn: AsyncConnection,
+    table: str,
+    key: str,
+    name: str,
+    start: date,
+    end: date,
+) -> None:
+    """
+    Create one monthly partition.
+    
+    PostgreSQL refuses to create a partition whose range already has rows in the
+    default partition. In that case the rows are moved out of the default
+    partition into a temporary table, the new partition is created and the rows
+    are inserted again through the parent table, all in the caller's
+    transaction. The default partition stays attached throughout, so row
+    triggers (e.g. the outcome daily summary) see a delete and an insert and
+    the aggregates stay balanced.
+    """
+    default = f"{table}_default"
+    stranded_rows = f"{name}_stranded"
+    bounds = f"FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    in_range = f"{key} >= '{start.isoformat()}' AND {key} < '{end.isoformat()}'"
+    
+    stranded = await conn.execute(
+        text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_range})")
+    )
+    if not stranded.scalar():
+        await conn.execute(text(f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES {bounds}"))
+        return
+    
+    logger.warning("Moving rows out of default partition", table=table, partition=name)
+    await conn.execute(text(f"CREATE TEMPORARY TABLE {stranded_rows} (LIKE {table})"))
+    await conn.execute(text(
+        f"WITH moved AS (DELETE FROM {default} WHERE {in_range} RETURNING *) "
+        f"INSERT INTO {stranded_rows} SELECT * FROM moved"
+    ))
+    await conn.execute(text(f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES {bounds}"))
+    await conn.execute(text(f"INSERT INTO {table} SELECT * FROM {stranded_rows}"))
+    await conn.execute(text(f"DROP TABLE {stranded_rows}"))
+
+
+async def maintain_partitions_forever() -> None:
+    """Keep future partitions ready, periodically, until cancelled."""
+    interval = settings.partition_maintenance_interval_minutes * 60
+    
+    while True:
+        try:
+            async with engine.begin() as conn:
+                created = await ensure_monthly_partitions(conn, settings.partition_months_ahead)
+            if created:
+                logger.info("Partitions created", partitions=created)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Partition maintenance failed", error=str(e))
+        
+        await asyncio.sleep(interval)
\ No newline at end of file
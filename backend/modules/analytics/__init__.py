@@ -0,0 +1,4 @@
+"""
+Analytics module.
+Handles streaming exports and aggregated reporting of negotiation outcomes.
+"""
\ No newline at end of file
@@ -0,0 +1,266 @@
+"""
+Streaming export of negotiation outcomes.
+Reads outcomes through a server-side cursor and yields them as NDJSON, CSV or
+Arrow IPC chunks, so memory use does not grow with the size of the export.
+"""
+
+import argparse
+import asyncio
+import csv
+import importlib.util
+import io
+import json
+import sys
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Sequence
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select
+
+from backend.core.database import AsyncSessionLocal
+from backend.core.settings import settings
+from backend.models import Outcome
+
+ExportFormat = Literal["ndjson", "csv", "arrow"]
+
+# Content types of the export formats
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+# Exported columns, in output order
+EXPORT_COLUMNS = (
+    Outcome.id,
+    Outcome.session_id,
+    Outcome.debtor_cpf,
+    Outcome.outcome,
+    Outcome.agreed_amount,
+    Outcome.discount_amount,
+    Outcome.payment_date,
+    Outcome.payment_slip_reference,
+    Outcome.interaction_timestamp,
+    Outcome.duration,
+    Outcome.turns,
+    Outcome.language,
+)
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+
+def arrow_available() -> bool:
+    """Check whether the optional pyarrow dependency is installed."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def day_bounds(start: date, end: date) -> tuple[datetime, datetime]:
+    """Convert an inclusive range of local days to a [start, end) timestamp range."""
+    tz = ZoneInfo(settings.default_timezone)
+    return (
+        datetime.combine(start, time.min, tzinfo=tz),
+        datetime.combine(end + timedelta(days=1), time.min, tzinfo=tz),
+    )
+
+
+async def stream_outcomes(
+    start: date,
+    end: date,
+    chunk_size: Optional[int] = None,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Stream outcomes of an inclusive range of local days in chunks.
+    
+    Rows are fetched as plain tuples (no ORM objects) through a server-side
+    cursor; the range predicate lets PostgreSQL prune outcome partitions.
+    
+    Args:
+        start: First day of the export
+        end: Last day of the export
+        chunk_size: Rows fetched per round trip
+        
+    Yields:
+        Lists of at most chunk_size outcome records
+    """
+    chunk_size = chunk_size or settings.export_chunk_size
+    start_at, end_at = day_bounds(start, end)
+    
+    statement = (
+        select(*EXPORT_COLUMNS)
+        .where(
+            Outcome.interaction_timestamp >= start_at,
+            Outcome.interaction_timestamp < end_at,
+        )
+        .order_by(Outcome.interaction_timestamp)
+        .execution_options(yield_per=chunk_size)
+    )
+    
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(statement)
+        async for rows in result.partitions():
+            yield [dict(zip(EXPORT_FIELDS, row)) for row in rows]
+
+
+def _json_value(value: Any) -> Any:
+    """
+    Convert database values to JSON friendly values.
+    
+    Decimals are kept as strings so amounts read the same in every format.
+    """
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+async def ndjson_chunks(chunks: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    """Encode outcome chunks as newline-delimited JSON."""
+    async for records in chunks:
+        yield "".join(
+            json.dumps({key: _json_value(value) for key, value in record.items()}) + "\n"
+            for record in records
+        ).encode("utf-8")
+
+
+async def csv_chunks(chunks: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    """Encode outcome chunks as CSV with a header row."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    
+    async for records in chunks:
+        writer.writerows(
+            {key: _json_value(value) for key, value in record.items()}
+            for record in records
+        )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    
+    # Header only export
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def arrow_chunks(chunks: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    """
+    Encode outcome chunks as an Arrow IPC stream, one record batch per chunk.
+    
+    Requires the optional pyarrow dependency (pip install "certobot[analytics]").
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise RuntimeError(
+            "Arrow export requires pyarrow: pip install 'certobot[analytics]'"
+        ) from e
+    
+    schema = pa.schema([
+        ("id", pa.string()),
+        ("session_id", pa.string()),
+        ("debtor_cpf", pa.string()),
+        ("outcome", pa.string()),
+        ("agreed_amount", pa.decimal128(12, 2)),
+        ("discount_amount", pa.decimal128(12, 2)),
+        ("payment_date", pa.timestamp("us", tz="UTC")),
+        ("payment_slip_reference", pa.string()),
+        ("interaction_timestamp", pa.timestamp("us", tz="UTC")),
+        ("duration", pa.int32()),
+        ("turns", pa.int32()),
+        ("language", pa.string()),
+    ])
+    
+    sink = _ChunkSink()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        async for records in chunks:
+            for record in records:
+                record["id"] = str(record["id"])
+            writer.write_batch(pa.RecordBatch.from_pylist(records, schema=schema))
+            yield sink.drain()
+    
+    # End-of-stream marker written on close
+    yield sink.drain()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object buffering Arrow output until it is drained."""
+    
+    def __init__(self):
+        super().__init__()
+        self._buffer = bytearray()
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data: Any) -> int:
+        self._buffer += data
+        return len(data)
+    
+    def drain(self) -> bytes:
+        """Return and clear the buffered bytes."""
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+EXPORT_ENCODERS = {
+    "ndjson": ndjson_chunks,
+    "csv": csv_chunks,
+    "arrow": arrow_chunks,
+}
+
+
+def export_outcomes(
+    start: date,
+    end: date,
+    export_format: ExportFormat = "ndjson",
+    chunk_size: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Export outcomes of an inclusive range of local days.
+    
+    Args:
+        start: First day of the export
+        end: Last day of the export
+        export_format: ndjson, csv or arrow
+        chunk_size: Rows fetched per round trip
+        
+    Returns:
+        Async iterator of encoded byte chunks
+    """
+    return EXPORT_ENCODERS[export_format](stream_outcomes(start, end, chunk_size))
+
+
+async def _write_export(args: argparse.Namespace) -> None:
+    """Write an export to a file or stdout."""
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        async for chunk in export_outcomes(args.start, args.end, args.format, args.chunk_size):
+            output.write(chunk)
+    finally:
+        if args.output:
+            output.close()
+        else:
+            output.flush()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command line entry point for outcome exports."""
+    today = date.today()
+    
+    parser = argparse.ArgumentParser(description="Export negotiation outcomes")
+    parser.add_argument("--format", choices=list(EXPORT_ENCODERS), default="ndjson")
+    parser.add_argument("--start", type=date.fromisoformat, default=today)
+    parser.add_argument("--end", type=date.fromisoformat, default=today)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--output", "-o", help="Output file (defaults to stdout)")
+    
+    asyncio.run(_write_export(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
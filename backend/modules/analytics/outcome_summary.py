@@ -0,0 +1,145 @@
+"""
+Outcome summary queries.
+Reads the daily outcome aggregates and rebuilds them from raw outcomes when needed.
+"""
+
+from datetime import date
+from typing import Any, Dict, List
+
+from sqlalchemy import case, delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.logging import LoggerMixin
+from backend.core.settings import settings
+from backend.models import Outcome, OutcomeDailySummary
+from backend.models.outcome_summary import AGREEMENT_OUTCOMES
+from backend.modules.analytics.outcome_export import day_bounds
+
+
+class OutcomeSummaryService(LoggerMixin):
+    """Service for dashboard aggregates of negotiation outcomes."""
+    
+    async def get_daily_summary(
+        self,
+        session: AsyncSession,
+        start: date,
+        end: date,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the daily aggregates of an inclusive range of local days.
+        
+        Only the summary table is read; raw outcomes are never scanned.
+        
+        Returns:
+            One entry per day with outcomes, ordered by day
+        """
+        result = await session.execute(
+            select(OutcomeDailySummary)
+            .where(OutcomeDailySummary.day >= start, OutcomeDailySummary.day <= end)
+            .order_by(OutcomeDailySummary.day)
+        )
+        
+        return [
+            {
+                "day": summary.day,
+                "total_outcomes": summary.total_outcomes,
+                "successful": summary.successful,
+                "partially_successful": summary.partially_successful,
+                "unsuccessful": summary.unsuccessful,
+                "no_contact": summary.no_contact,
+                "agreements": summary.agreements,
+                "success_rate": summary.success_rate,
+                "recovered_amount": str(summary.recovered_amount),
+                "average_turns_per_agreement": summary.average_turns_per_agreement,
+            }
+            for summary in result.scalars()
+        ]
+    
+    async def rebuild_daily_summary(
+        self,
+        session: AsyncSession,
+        start: date,
+        end: date,
+    ) -> int:
+        """
+        Recompute the daily aggregates of an inclusive range of local days from
+        the raw outcomes, e.g. after a backfill or a manual correction.
+        
+        The summary table is locked against the outcome triggers for the length
+        of the rebuild: an outcome written concurrently waits and is then added
+        on top of the rebuilt row, instead of colliding with the insert or being
+        overwritten by it.
+        
+        Returns:
+            Number of days rebuilt
+        """
+        start_at, end_at = day_bounds(start, end)
+        day = func.date(func.timezone(settings.default_timezone, Outcome.interaction_timestamp))
+        is_agreement = Outcome.outcome.in_(AGREEMENT_OUTCOMES)
+        
+        def count_if(condition: Any) -> Any:
+            return func.count().filter(condition)
+        
+        aggregates = (
+            select(
+                day,
+                func.count(),
+                count_if(Outcome.outcome == "successful"),
+                count_if(Outcome.outcome == "partially_successful"),
+                count_if(Outcome.outcome == "unsuccessful"),
+                count_if(Outcome.outcome == "no_contact"),
+                count_if(is_agreement),
+                func.coalesce(
+                    func.sum(case((is_agreement, Outcome.agreed_amount), else_=0)), 0
+                ),
+                func.coalesce(func.sum(case((is_agreement, Outcome.turns), else_=0)), 0),
+                func.now(),
+            )
+            .where(
+                Outcome.interaction_timestamp >= start_at,
+                Outcome.interaction_timestamp < end_at,
+            )
+            .group_by(day)
+        )
+        
+        # Conflicts with the ROW EXCLUSIVE lock taken by the trigger upserts, and
+        # waits for writers already holding it to commit
+        await session.execute(text(
+            f"LOCK TABLE {OutcomeDailySummary.__tablename__} IN EXCLUSIVE MODE"
+        ))
+        await session.execute(
+            delete(OutcomeDailySummary).where(
+                OutcomeDailySummary.day >= start,
+                OutcomeDailySummary.day <= end,
+            )
+        )
+        result = await session.execute(
+            insert(OutcomeDailySummary).from_select(
+                [
+                    "day",
+                    "total_outcomes",
+                    "successful",
+                    "partially_successful",
+                    "unsuccessful",
+                    "no_contact",
+                    "agreements",
+                    "recovered_amount",
+                    "agreement_turns",
+                    "updated_at",
+                ],
+                aggregates,
+            )
+        )
+        await session.commit()
+        
+        self.log_info(
+            "Outcome summary rebuilt",
+            start=start.isoformat(),
+            end=end.isoformat(),
+            days=result.rowcount,
+        )
+        return result.rowcount
+
+
+# Global summary service instance
+outcome_summary_service = OutcomeSummaryService()
\ No newline at end of file
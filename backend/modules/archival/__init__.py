@@ -0,0 +1,4 @@
+"""
+Archival module.
+Handles moving closed conversations out of PostgreSQL into compressed cold storage.
+"""
\ No newline at end of file
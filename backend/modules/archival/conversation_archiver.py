@@ -0,0 +1,214 @@
+"""
+Conversation archival job.
+Moves closed conversations and their messages to compressed NDJSON files on
+local disk so the hot tables only hold recent data.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.database import AsyncSessionLocal
+from backend.core.logging import LoggerMixin
+from backend.core.settings import settings
+from backend.models import Conversation, Message
+from backend.models.conversation import CLOSED_CONVERSATION_STATUSES
+
+
+class ConversationArchiver(LoggerMixin):
+    """Background job archiving closed conversations to NDJSON.gz files."""
+    
+    def __init__(
+        self,
+        archive_dir: Optional[str] = None,
+        after_days: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
+        self.archive_dir = Path(archive_dir or settings.archive_dir)
+        self.after_days = after_days if after_days is not None else settings.archive_after_days
+        self.batch_size = batch_size or settings.archive_batch_size
+        self.session_factory = session_factory or AsyncSessionLocal
+    
+    async def archive_batch(self) -> int:
+        """
+        Archive one batch of closed conversations.
+        
+        The archive file is written and synced to disk before the rows are
+        deleted, in the same transaction, so neither a failure nor a crash after
+        the commit loses data. Batches are selected in a stable order, so a
+        retried batch overwrites its own file.
+        
+        Returns:
+            Number of conversations archived
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.after_days)
+        
+        async with self.session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    select(Conversation)
+                    .where(
+                        Conversation.status.in_(CLOSED_CONVERSATION_STATUSES),
+                        Conversation.end_time < cutoff,
+                    )
+                    .order_by(Conversation.end_time, Conversation.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                conversations = list(result.scalars())
+                if not conversations:
+                    return 0
+                
+                ids = [conversation.id for conversation in conversations]
+                
+                # Messages are not bounded by start_time: WhatsApp timestamps may
+                # predate the conversation row, and every message must be archived
+                messages = await self._load_messages(session, ids)
+                archived_messages = sum(len(batch) for batch in messages.values())
+                records = [
+                    self._serialize(conversation, messages.get(conversation.id, []))
+                    for conversation in conversations
+                ]
+                path = await asyncio.to_thread(self._write_archive, conversations[0], records)
+                
+                deleted = await session.execute(
+                    delete(Message).where(Message.conversation_id.in_(ids))
+                )
+                if deleted.rowcount != archived_messages:
+                    # Rolls back the transaction; the archive file is rewritten next run
+                    raise RuntimeError(
+                        f"Archived {archived_messages} messages but would delete "
+                        f"{deleted.rowcount}"
+                    )
+                
+                # Outcomes keep their session_id; conversation_id is cleared by the FK
+                await session.execute(delete(Conversation).where(Conversation.id.in_(ids)))
+        
+        self.log_info(
+            "Conversations archived",
+            conversations=len(conversations),
+            messages=archived_messages,
+            path=str(path),
+        )
+        return len(conversations)
+    
+    async def run_once(self) -> int:
+        """
+        Archive every conversation due for archival.
+        
+        Returns:
+            Total number of conversations archived
+        """
+        total = 0
+        while True:
+            archived = await self.archive_batch()
+            total += archived
+            if archived < self.batch_size:
+                return total
+    
+    async def run_forever(self) -> None:
+        """Run the archival job periodically until cancelled."""
+        interval = settings.archive_interval_minutes * 60
+        
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.log_error("Conversation archival failed", error=str(e))
+            
+            await asyncio.sleep(interval)
+    
+    async def _load_messages(
+        self,
+        session: AsyncSession,
+        conversation_ids: List[Any],
+    ) -> Dict[Any, List[Message]]:
+        """Load all messages of the given conversations grouped by conversation."""
+        result = await session.execute(
+            select(Message)
+            .where(Message.conversation_id.in_(conversation_ids))
+            .order_by(Message.conversation_id, Message.created_at)
+        )
+        
+        messages: Dict[Any, List[Message]] = {}
+        for message in result.scalars():
+            messages.setdefault(message.conversation_id, []).append(message)
+        return messages
+    
+    def _serialize(self, conversation: Conversation, messages: List[Message]) -> Dict[str, Any]:
+        """Convert a conversation and its messages to an archive record."""
+        return {
+            "id": conversation.id,
+            "session_id": conversation.session_id,
+            "debtor_id": conversation.debtor_id,
+            "debt_id": conversation.debt_id,
+            "phone": conversation.phone,
+            "status": conversation.status,
+            "start_time": conversation.start_time,
+            "end_time": conversation.end_time,
+            "messages": [
+                {
+                    "id": message.id,
+                    "created_at": message.created_at,
+                    "sender": message.sender,
+                    "content": message.content,
+                    "message_type": message.message_type,
+                    "metadata": message.message_metadata,
+                }
+                for message in messages
+            ],
+        }
+    
+    def _write_archive(self, first: Conversation, records: List[Dict[str, Any]]) -> Path:
+        """
+        Write records to a gzip-compressed NDJSON file, bucketed by closing day.
+        
+        The file is written to a temporary path, synced and atomically renamed,
+        and the rename is synced too, so readers never see a partial archive and
+        the archive is durable before the rows are deleted.
+        """
+        closed = first.end_time.astimezone(timezone.utc)
+        directory = self.archive_dir / "conversations" / closed.strftime("%Y/%m/%d")
+        directory.mkdir(parents=True, exist_ok=True)
+        
+        path = directory / f"conversations-{first.id}.ndjson.gz"
+        tmp_path = path.with_name(path.name + ".tmp")
+        
+        with open(tmp_path, "wb") as raw:
+            with gzip.open(raw, "wt", encoding="utf-8") as archive:
+                for record in records:
+                    archive.write(json.dumps(record, default=str, ensure_ascii=False))
+                    archive.write("\n")
+            raw.flush()
+            os.fsync(raw.fileno())
+        
+        os.replace(tmp_path, path)
+        _fsync_directory(directory)
+        return path
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist the entries of a directory (e.g. a rename) to disk."""
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# Global archiver instance
+conversation_archiver = ConversationArchiver()
+
+
+if __name__ == "__main__":
+    asyncio.run(conversation_archiver.run_once())
\ No newline at end of file
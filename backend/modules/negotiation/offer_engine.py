@@ -0,0 +1,337 @@
+"""
+Negotiation offer engine.
+Precomputes the permitted offer grid (discount tiers x installment counts) for
+every debtor of a campaign and caches it in Redis for constant-time lookups
+during a conversation.
+"""
+
+import bisect
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Iterator, List, Mapping, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from backend.core.logging import LoggerMixin
+from backend.core.redis import RedisCache, cache
+from backend.core.settings import settings
+from backend.modules.validation.cpf_validator import cpf_validator
+
+# Redis key prefix for cached offer grids
+OFFER_GRID_KEY_PREFIX = "negotiation:offers"
+
+# Hash field holding the grid metadata
+OFFER_GRID_META_FIELD = "meta"
+
+# Percentages are handled in basis points and amounts in cents to avoid
+# floating point drift when rounding to BRL cents
+BASIS_POINTS = 10_000
+BPS_PER_PERCENT = BASIS_POINTS // 100
+CENTS = 100
+
+# Debtors serialized and written to Redis per pipeline when loading a campaign
+LOAD_CHUNK_SIZE = 1000
+
+
+class NegotiationOffer(BaseModel):
+    """A single permitted payment offer for a debtor."""
+    
+    discount_bps: int
+    installments: int
+    total_cents: int
+    installment_cents: int
+    first_installment_cents: int
+    
+    @property
+    def discount_percentage(self) -> float:
+        """Discount applied to the debt in percent."""
+        return self.discount_bps / BPS_PER_PERCENT
+    
+    @property
+    def total_amount(self) -> float:
+        """Total amount to be paid in BRL."""
+        return self.total_cents / CENTS
+    
+    @property
+    def installment_amount(self) -> float:
+        """Amount of each regular installment in BRL."""
+        return self.installment_cents / CENTS
+    
+    @property
+    def first_installment_amount(self) -> float:
+        """Amount of the first installment in BRL (absorbs the rounding remainder)."""
+        return self.first_installment_cents / CENTS
+
+
+@dataclass(frozen=True)
+class OfferGrid:
+    """
+    Vectorized offer grid for a batch of debtors.
+    
+    Arrays are indexed as [debtor, discount tier, installment option].
+    """
+    
+    cpfs: List[str]
+    discount_bps: np.ndarray  # (T,)
+    installments: np.ndarray  # (N,)
+    total_cents: np.ndarray  # (D, T)
+    installment_cents: np.ndarray  # (D, T, N)
+    first_installment_cents: np.ndarray  # (D, T, N)
+    valid: np.ndarray  # (D, T, N)
+    max_installments: np.ndarray  # (D, T)
+    
+    def offers_for(self, index: int) -> Dict[str, List[int]]:
+        """Serialize the permitted offers of one debtor as Redis hash fields."""
+        offers: Dict[str, List[int]] = {}
+        for tier, option in zip(*np.nonzero(self.valid[index])):
+            field = offer_field(int(self.discount_bps[tier]), int(self.installments[option]))
+            offers[field] = [
+                int(self.total_cents[index, tier]),
+                int(self.installment_cents[index, tier, option]),
+                int(self.first_installment_cents[index, tier, option]),
+            ]
+        return offers
+    
+    def meta_for(self, index: int) -> Dict[str, object]:
+        """Metadata needed to snap a request onto the grid of one debtor."""
+        return {
+            "discount_bps": self.discount_bps.tolist(),
+            "max_installments": self.max_installments[index].tolist(),
+        }
+
+
+def offer_grid_key(cpf: str) -> str:
+    """Redis key holding the offer grid of a debtor."""
+    return f"{OFFER_GRID_KEY_PREFIX}:{''.join(filter(str.isdigit, cpf))}"
+
+
+def offer_field(discount_bps: int, installments: int) -> str:
+    """Redis hash field of a single offer."""
+    return f"{discount_bps}:{installments}"
+
+
+def discount_tiers(
+    max_discount_percentage: float,
+    step_percentage: float,
+) -> np.ndarray:
+    """
+    Build the discount tiers in basis points.
+    
+    Args:
+        max_discount_percentage: Highest discount allowed
+        step_percentage: Distance between two consecutive tiers
+    
+    Returns:
+        Sorted tiers starting at 0 and always including the maximum discount
+        
+    Raises:
+        ValueError: If the maximum discount is outside 0-100%
+    """
+    if not 0 <= max_discount_percentage <= 100:
+        raise ValueError(
+            f"max_discount_percentage must be between 0 and 100, got {max_discount_percentage}"
+        )
+    
+    max_bps = int(round(max_discount_percentage * BPS_PER_PERCENT))
+    step_bps = max(int(round(step_percentage * BPS_PER_PERCENT)), 1)
+    
+    tiers = np.arange(0, max_bps + 1, step_bps, dtype=np.int64)
+    if tiers[-1] != max_bps:
+        tiers = np.append(tiers, max_bps)
+    return tiers
+
+
+def build_offer_grid(
+    balances: Mapping[str, float],
+    max_discount_percentage: Optional[float] = None,
+    min_payment_amount: Optional[float] = None,
+    max_installments: Optional[int] = None,
+    step_percentage: Optional[float] = None,
+) -> OfferGrid:
+    """
+    Precompute the offer grid for a batch of debtors in a single vectorized pass.
+    
+    Every offer is rounded to BRL cents: the discounted total is rounded half up
+    and split into equal installments, the remainder being added to the first one
+    so the installments always add up to the total. Installment plans whose
+    regular installment falls below the minimum payment are not permitted; a
+    single payment is always permitted so small balances can still be settled.
+    
+    Args:
+        balances: Current debt amount in BRL keyed by debtor CPF
+        max_discount_percentage: Defaults to the configured maximum discount
+        min_payment_amount: Defaults to the configured minimum payment
+        max_installments: Defaults to the configured maximum installments
+        step_percentage: Defaults to the configured discount tier step
+    
+    Returns:
+        The offer grid for all debtors
+    """
+    if max_discount_percentage is None:
+        max_discount_percentage = settings.max_discount_percentage
+    if min_payment_amount is None:
+        min_payment_amount = settings.min_payment_amount
+    if max_installments is None:
+        max_installments = settings.max_installments
+    if step_percentage is None:
+        step_percentage = settings.discount_tier_step_percentage
+    
+    cpfs = list(balances)
+    amount_cents = np.rint(
+        np.fromiter(balances.values(), dtype=np.float64, count=len(cpfs)) * CENTS
+    ).astype(np.int64)
+    min_cents = int(round(min_payment_amount * CENTS))
+    
+    tiers = discount_tiers(max_discount_percentage, step_percentage)
+    options = np.arange(1, max(max_installments, 1) + 1, dtype=np.int64)
+    
+    # (D, T): discounted totals, rounded half up to the cent
+    total = (
+        amount_cents[:, None] * (BASIS_POINTS - tiers)[None, :] + BASIS_POINTS // 2
+    ) // BASIS_POINTS
+    
+    # (D, T, N): equal installments with the remainder on the first one
+    installment = total[:, :, None] // options[None, None, :]
+    first = installment + total[:, :, None] % options[None, None, :]
+    
+    valid = (installment >= min_cents) | (options == 1)[None, None, :]
+    valid &= (amount_cents > 0)[:, None, None]
+    
+    # Installments only shrink as their count grows, so the permitted counts of a
+    # tier always form a prefix and the largest one is enough to clamp requests
+    max_allowed = np.where(valid, options[None, None, :], 0).max(axis=2)
+    
+    return OfferGrid(
+        cpfs=cpfs,
+        discount_bps=tiers,
+        installments=options,
+        total_cents=total,
+        installment_cents=installment,
+        first_installment_cents=first,
+        valid=valid,
+        max_installments=max_allowed,
+    )
+
+
+class OfferEngine(LoggerMixin):
+    """Builds, caches and queries negotiation offer grids."""
+    
+    def __init__(self, redis_cache: Optional[RedisCache] = None):
+        self.cache = redis_cache or cache
+    
+    async def load_campaign(
+        self,
+        balances: Mapping[str, float],
+        chunk_size: int = LOAD_CHUNK_SIZE,
+    ) -> int:
+        """
+        Precompute and cache the offer grids of every debtor in a campaign.
+        
+        Debtors are processed in chunks so the grid arrays, the serialized
+        offers and the Redis pipeline buffer stay bounded for large campaigns.
+        
+        Args:
+            balances: Current debt amount in BRL keyed by debtor CPF
+            chunk_size: Debtors built and written per Redis pipeline
+        
+        Returns:
+            Number of debtors whose grid was cached
+        """
+        cached = 0
+        
+        for chunk in _chunked(balances, chunk_size):
+            grid = build_offer_grid(chunk)
+            
+            hashes: Dict[str, Dict[str, object]] = {}
+            for index, cpf in enumerate(grid.cpfs):
+                fields: Dict[str, object] = dict(grid.offers_for(index))
+                fields[OFFER_GRID_META_FIELD] = grid.meta_for(index)
+                hashes[offer_grid_key(cpf)] = fields
+            
+            await self.cache.set_hashes(
+                hashes, expire=settings.offer_grid_cache_ttl_seconds
+            )
+            cached += len(hashes)
+        
+        self.log_info("Offer grids cached", debtors=cached)
+        return cached
+    
+    async def get_offer(
+        self,
+        cpf: str,
+        discount_percentage: float,
+        installments: int,
+    ) -> Optional[NegotiationOffer]:
+        """Get an exact offer from the cached grid, if it is permitted."""
+        discount_bps = int(round(discount_percentage * BPS_PER_PERCENT))
+        value = await self.cache.hget_json(
+            offer_grid_key(cpf), offer_field(discount_bps, installments)
+        )
+        if value is None:
+            return None
+        
+        total, installment, first = value
+        return NegotiationOffer(
+            discount_bps=discount_bps,
+            installments=installments,
+            total_cents=total,
+            installment_cents=installment,
+            first_installment_cents=first,
+        )
+    
+    async def best_counter_offer(
+        self,
+        cpf: str,
+        requested_discount_percentage: float = 0.0,
+        requested_installments: int = 1,
+    ) -> Optional[NegotiationOffer]:
+        """
+        Find the permitted offer closest to what the debtor asked for.
+        
+        The requested discount is snapped down to the nearest tier and the
+        installment count is clamped to the largest one permitted for that tier.
+        A debtor with nothing left to pay has no permitted offer at all.
+        
+        Args:
+            cpf: Debtor CPF
+            requested_discount_percentage: Discount asked for by the debtor
+            requested_installments: Number of installments asked for by the debtor
+        
+        Returns:
+            The counter-offer, or None if no grid is cached for the debtor or
+            the debtor has no permitted offer (zero balance)
+        """
+        meta = await self.cache.hget_json(offer_grid_key(cpf), OFFER_GRID_META_FIELD)
+        if meta is None:
+            self.log_warning(
+                "Offer grid not cached", cpf_masked=cpf_validator._mask_cpf(cpf)
+            )
+            return None
+        
+        tiers = meta["discount_bps"]
+        requested_bps = int(
+            round(max(requested_discount_percentage, 0.0) * BPS_PER_PERCENT)
+        )
+        # Tiers start at 0, so the lookup never falls below the first one
+        tier = bisect.bisect_right(tiers, requested_bps) - 1
+        
+        installments = min(max(requested_installments, 1), meta["max_installments"][tier])
+        if installments < 1:
+            self.log_info(
+                "No offer permitted", cpf_masked=cpf_validator._mask_cpf(cpf)
+            )
+            return None
+        
+        return await self.get_offer(cpf, tiers[tier] / BPS_PER_PERCENT, installments)
+
+
+def _chunked(balances: Mapping[str, float], size: int) -> Iterator[Dict[str, float]]:
+    """Split balances into dicts of at most size debtors."""
+    items = iter(balances.items())
+    while chunk := dict(islice(items, size)):
+        yield chunk
+
+
+# Global offer engine instance
+offer_engine = OfferEngine()
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Shared fixtures for tests that need PostgreSQL.
+
+Tests marked with "database" only run when TEST_DATABASE_URL points to a
+disposable database (postgresql+asyncpg://...); see "make test-db".
+"""
+
+import os
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.core.database import Base
+from backend.core.settings import settings
+from backend.models.partitioning import ensure_monthly_partitions
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+def pytest_collection_modifyitems(config, items):
+    if TEST_DATABASE_URL:
+        return
+    
+    skip = pytest.mark.skip(reason="TEST_DATABASE_URL not set")
+    for item in items:
+        if "database" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+async def db_engine():
+    """Engine on the test database, with the schema created."""
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await ensure_monthly_partitions(conn, settings.partition_months_ahead)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_conn(db_engine):
+    """Connection inside a transaction that is rolled back after the test."""
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        yield conn
+        await transaction.rollback()
\ No newline at end of file
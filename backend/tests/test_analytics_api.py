@@ -0,0 +1,62 @@
+"""
+Tests for the analytics API access control.
+"""
+
+from datetime import timedelta
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from backend.api.v1.analytics import router
+from backend.core.security import create_access_token
+
+EXPORT_URL = "/api/v1/analytics/outcomes/export"
+INVERTED_RANGE = {"start": "2025-01-10", "end": "2025-01-01"}
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1/analytics")
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+def auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestAnalyticsAuth:
+    """Tests for the token requirement on analytics endpoints."""
+    
+    async def test_missing_token_is_rejected(self, client):
+        response = await client.get(EXPORT_URL, params=INVERTED_RANGE)
+        
+        assert response.status_code == 401
+    
+    async def test_invalid_token_is_rejected(self, client):
+        response = await client.get(EXPORT_URL, params=INVERTED_RANGE, headers=auth("garbage"))
+        
+        assert response.status_code == 401
+    
+    async def test_expired_token_is_rejected(self, client):
+        token = create_access_token("reports", expires_delta=timedelta(minutes=-1))
+        
+        response = await client.get(EXPORT_URL, params=INVERTED_RANGE, headers=auth(token))
+        
+        assert response.status_code == 401
+    
+    async def test_rebuild_requires_token(self, client):
+        response = await client.post(
+            "/api/v1/analytics/outcomes/summary/rebuild", params=INVERTED_RANGE
+        )
+        
+        assert response.status_code == 401
+    
+    async def test_valid_token_reaches_endpoint(self, client):
+        token = create_access_token("reports")
+        
+        response = await client.get(EXPORT_URL, params=INVERTED_RANGE, headers=auth(token))
+        
+        assert response.status_code == 400
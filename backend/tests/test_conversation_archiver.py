@@ -0,0 +1,232 @@
+"""
+Tests for the conversation archival job.
+"""
+
+import gzip
+import json
+
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Conversation, Message, Outcome, OutcomeDailySummary
+from backend.modules.archival import conversation_archiver as archiver_module
+from backend.modules.archival.conversation_archiver import ConversationArchiver
+
+# Conversations closed long ago, so only the test rows are due for archival
+CLOSED_AT = datetime(2001, 1, 5, 18, 0, tzinfo=timezone.utc)
+ARCHIVE_CUTOFF = datetime(2002, 1, 1, tzinfo=timezone.utc)
+
+
+def make_conversation(end_time):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        session_id="session-1",
+        debtor_id=None,
+        debt_id=None,
+        phone="5511999990000",
+        status="completed",
+        start_time=datetime(2025, 1, 10, 12, 0, tzinfo=timezone.utc),
+        end_time=end_time,
+    )
+
+
+def make_message(content):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        created_at=datetime(2025, 1, 10, 11, 59, tzinfo=timezone.utc),
+        sender="debtor",
+        content=content,
+        message_type="text",
+        message_metadata={"wa_id": "1"},
+    )
+
+
+class TestConversationArchiver:
+    """Tests for archive serialization and file layout."""
+    
+    def test_write_archive_buckets_by_closing_day(self, tmp_path):
+        archiver = ConversationArchiver(archive_dir=str(tmp_path))
+        conversation = make_conversation(datetime(2025, 1, 11, 1, 30, tzinfo=timezone.utc))
+        record = archiver._serialize(conversation, [make_message("olá"), make_message("sim")])
+        
+        path = archiver._write_archive(conversation, [record])
+        
+        assert path == (
+            tmp_path / "conversations" / "2025" / "01" / "11"
+            / f"conversations-{conversation.id}.ndjson.gz"
+        )
+        assert not path.with_name(path.name + ".tmp").exists()
+        
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            lines = archive.read().splitlines()
+        assert len(lines) == 1
+        
+        archived = json.loads(lines[0])
+        assert archived["id"] == str(conversation.id)
+        assert [message["content"] for message in archived["messages"]] == ["olá", "sim"]
+        assert archived["messages"][0]["metadata"] == {"wa_id": "1"}
+    
+    def test_rewriting_a_batch_overwrites_its_file(self, tmp_path):
+        archiver = ConversationArchiver(archive_dir=str(tmp_path))
+        conversation = make_conversation(datetime(2025, 1, 11, tzinfo=timezone.utc))
+        record = archiver._serialize(conversation, [])
+        
+        first = archiver._write_archive(conversation, [record])
+        second = archiver._write_archive(conversation, [record])
+        
+        assert first == second
+        assert len(list(tmp_path.rglob("*.ndjson.gz"))) == 1
+    
+    def test_archive_is_synced_before_returning(self, tmp_path, monkeypatch):
+        synced = []
+        monkeypatch.setattr(archiver_module.os, "fsync", lambda fd: synced.append(fd))
+        archiver = ConversationArchiver(archive_dir=str(tmp_path))
+        conversation = make_conversation(datetime(2025, 1, 11, tzinfo=timezone.utc))
+        
+        archiver._write_archive(conversation, [archiver._serialize(conversation, [])])
+        
+        # The archive file, then its directory after the rename
+        assert len(synced) == 2
+
+
+async def add_conversation(conn, status="completed", end_time=CLOSED_AT, messages=1):
+    conversation_id = uuid.uuid4()
+    await conn.execute(insert(Conversation).values(
+        id=conversation_id,
+        session_id=f"test-{conversation_id}",
+        phone="5511999990000",
+        status=status,
+        start_time=CLOSED_AT.replace(hour=12),
+        end_time=end_time,
+    ))
+    for index in range(messages):
+        await conn.execute(insert(Message).values(
+            conversation_id=conversation_id,
+            # The first message predates the conversation row
+            created_at=CLOSED_AT.replace(hour=11 + index),
+            sender="debtor",
+            content=f"mensagem {index}",
+        ))
+    return conversation_id
+
+
+@pytest.mark.database
+class TestArchiveBatch:
+    """Tests for the destructive archival path against PostgreSQL."""
+    
+    @pytest.fixture
+    async def conversations(self, db_engine):
+        async with db_engine.begin() as conn:
+            first = await add_conversation(conn, messages=2)
+            second = await add_conversation(
+                conn, status="abandoned", end_time=CLOSED_AT.replace(hour=20)
+            )
+            active = await add_conversation(conn, status="active", end_time=None)
+            recent = await add_conversation(conn, end_time=datetime.now(timezone.utc))
+            await conn.execute(insert(Outcome).values(
+                conversation_id=first,
+                session_id=f"test-{first}",
+                debtor_cpf="12345678909",
+                outcome="successful",
+                agreed_amount=Decimal("50.00"),
+                qualitative_notes="ok",
+                duration=60,
+                interaction_timestamp=CLOSED_AT,
+            ))
+        ids = [first, second, active, recent]
+        
+        yield ids
+        
+        async with db_engine.begin() as conn:
+            await conn.execute(
+                delete(Outcome).where(Outcome.session_id.in_([f"test-{i}" for i in ids]))
+            )
+            await conn.execute(delete(Conversation).where(Conversation.id.in_(ids)))
+            await conn.execute(delete(OutcomeDailySummary).where(
+                OutcomeDailySummary.day < ARCHIVE_CUTOFF.date()
+            ))
+    
+    @pytest.fixture
+    def archiver(self, db_engine, tmp_path):
+        return ConversationArchiver(
+            archive_dir=str(tmp_path),
+            after_days=(datetime.now(timezone.utc) - ARCHIVE_CUTOFF).days,
+            batch_size=10,
+            session_factory=sessionmaker(
+                db_engine, class_=AsyncSession, expire_on_commit=False
+            ),
+        )
+    
+    async def remaining(self, db_engine, ids):
+        async with db_engine.connect() as conn:
+            conversations = await conn.execute(
+                select(Conversation.id).where(Conversation.id.in_(ids))
+            )
+            messages = await conn.execute(
+                select(func.count())
+                .select_from(Message)
+                .where(Message.conversation_id.in_(ids))
+            )
+            return set(conversations.scalars()), messages.scalar()
+    
+    async def test_archives_closed_conversations_and_deletes_them(
+        self, db_engine, archiver, conversations, tmp_path
+    ):
+        first, second, active, recent = conversations
+        
+        assert await archiver.archive_batch() == 2
+        
+        (path,) = tmp_path.rglob("*.ndjson.gz")
+        assert path.name == f"conversations-{first}.ndjson.gz"
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            records = [json.loads(line) for line in archive]
+        assert [record["id"] for record in records] == [str(first), str(second)]
+        assert [len(record["messages"]) for record in records] == [2, 1]
+        
+        assert await self.remaining(db_engine, conversations) == ({active, recent}, 2)
+        
+        # Outcomes outlive their conversation
+        async with db_engine.connect() as conn:
+            outcome = await conn.execute(
+                select(Outcome.conversation_id).where(Outcome.session_id == f"test-{first}")
+            )
+            assert outcome.scalar_one() is None
+    
+    async def test_skips_conversations_locked_by_another_worker(
+        self, db_engine, archiver, conversations
+    ):
+        first, second, active, recent = conversations
+        
+        async with db_engine.connect() as other:
+            async with other.begin():
+                await other.execute(
+                    select(Conversation.id).where(Conversation.id == first).with_for_update()
+                )
+                
+                assert await archiver.archive_batch() == 1
+        
+        assert await self.remaining(db_engine, conversations) == ({first, active, recent}, 4)
+    
+    async def test_message_count_mismatch_rolls_back(
+        self, db_engine, archiver, conversations, monkeypatch
+    ):
+        load_messages = archiver._load_messages
+        
+        async def drop_one_message(session, ids):
+            messages = await load_messages(session, ids)
+            next(iter(messages.values())).pop()
+            return messages
+        
+        monkeypatch.setattr(archiver, "_load_messages", drop_one_message)
+        
+        with pytest.raises(RuntimeError):
+            await archiver.archive_batch()
+        
+        assert await self.remaining(db_engine, conversations) == (set(conversations), 5)
\ No newline at end of file
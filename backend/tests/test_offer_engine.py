@@ -0,0 +1,155 @@
+"""
+Tests for the negotiation offer engine.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from backend.modules.negotiation.offer_engine import (
+    OFFER_GRID_META_FIELD,
+    NegotiationOffer,
+    OfferEngine,
+    build_offer_grid,
+    discount_tiers,
+    offer_grid_key,
+)
+
+
+class FakeCache:
+    """In-memory stand-in for the Redis hash helpers used by the engine."""
+    
+    def __init__(self):
+        self.hashes = {}
+        self.calls = 0
+    
+    async def set_hashes(self, hashes, expire=None):
+        self.calls += 1
+        for key, mapping in hashes.items():
+            self.hashes[key] = {field: json.dumps(value) for field, value in mapping.items()}
+        return len(hashes)
+    
+    async def hget_json(self, key, field):
+        value = self.hashes.get(key, {}).get(field)
+        return None if value is None else json.loads(value)
+
+
+def build(balances, **kwargs):
+    params = dict(
+        max_discount_percentage=50.0,
+        min_payment_amount=10.0,
+        max_installments=12,
+        step_percentage=5.0,
+    )
+    params.update(kwargs)
+    return build_offer_grid(balances, **params)
+
+
+class TestDiscountTiers:
+    """Tests for discount tier generation."""
+    
+    def test_evenly_spaced_tiers(self):
+        assert discount_tiers(50.0, 5.0).tolist() == list(range(0, 5001, 500))
+    
+    def test_short_last_step_includes_maximum(self):
+        assert discount_tiers(50.0, 15.0).tolist() == [0, 1500, 3000, 4500, 5000]
+    
+    def test_negative_maximum_is_rejected(self):
+        with pytest.raises(ValueError):
+            discount_tiers(-1.0, 5.0)
+
+
+class TestBuildOfferGrid:
+    """Tests for the vectorized offer grid."""
+    
+    def test_totals_rounded_half_up_to_cents(self):
+        # 33.33 with 5% off is 31.6635 -> 31.66; 10% off is 29.997 -> 30.00
+        grid = build({"1": 33.33})
+        assert grid.total_cents[0, 1] == 3166
+        assert grid.total_cents[0, 2] == 3000
+    
+    def test_remainder_goes_on_first_installment(self):
+        grid = build({"1": 1000.0})
+        tier = grid.discount_bps.tolist().index(500)
+        # 950.00 in 3 installments: 316.66 + 316.66 + 316.68
+        assert grid.installment_cents[0, tier, 2] == 31666
+        assert grid.first_installment_cents[0, tier, 2] == 31668
+        
+        totals = grid.installment_cents[0] * grid.installments + (
+            grid.first_installment_cents[0] - grid.installment_cents[0]
+        )
+        assert np.array_equal(totals, np.repeat(grid.total_cents[0][:, None], 12, axis=1))
+    
+    def test_minimum_payment_cutoff(self):
+        grid = build({"1": 100.0})
+        # 100.00 allows up to 10 installments of 10.00 without discount
+        assert grid.max_installments[0, 0] == 10
+        # 50% off leaves 50.00, so 5 installments of 10.00
+        assert grid.max_installments[0, -1] == 5
+        assert not grid.valid[0, 0, 10]
+    
+    def test_small_balance_allows_single_payment(self):
+        grid = build({"1": 8.0})
+        assert grid.max_installments[0].tolist() == [1] * len(grid.discount_bps)
+    
+    def test_zero_balance_has_no_offers(self):
+        grid = build({"1": 0.0})
+        assert not grid.valid.any()
+        assert grid.offers_for(0) == {}
+
+
+class TestOfferEngine:
+    """Tests for caching and counter-offer lookups."""
+    
+    @pytest.fixture
+    def engine(self):
+        return OfferEngine(FakeCache())
+    
+    async def test_load_campaign_in_chunks(self, engine):
+        balances = {f"{i:011d}": 100.0 + i for i in range(5)}
+        
+        assert await engine.load_campaign(balances, chunk_size=2) == 5
+        assert engine.cache.calls == 3
+        assert OFFER_GRID_META_FIELD in engine.cache.hashes[offer_grid_key("00000000004")]
+    
+    async def test_counter_offer_snaps_discount_and_clamps_installments(self, engine):
+        await engine.load_campaign({"123.456.789-09": 1000.0})
+        
+        offer = await engine.best_counter_offer("12345678909", 33.0, 100)
+        
+        assert offer == NegotiationOffer(
+            discount_bps=3000,
+            installments=12,
+            total_cents=70000,
+            installment_cents=5833,
+            first_installment_cents=5837,
+        )
+        assert offer.discount_percentage == 30.0
+    
+    async def test_counter_offer_caps_at_maximum_discount(self, engine):
+        await engine.load_campaign({"12345678909": 1000.0})
+        
+        offer = await engine.best_counter_offer("12345678909", 90.0, 1)
+        
+        assert offer.discount_bps == 5000
+        assert offer.total_amount == 500.0
+    
+    async def test_counter_offer_snaps_onto_uneven_tiers(self, engine):
+        await engine.load_campaign({"12345678909": 1000.0})
+        key = offer_grid_key("12345678909")
+        meta = json.loads(engine.cache.hashes[key][OFFER_GRID_META_FIELD])
+        meta["discount_bps"] = [0, 500, 1500, 4500, 5000]
+        engine.cache.hashes[key][OFFER_GRID_META_FIELD] = json.dumps(meta)
+        
+        offer = await engine.best_counter_offer("12345678909", 40.0, 1)
+        
+        assert offer.discount_bps == 1500
+    
+    async def test_counter_offer_for_zero_balance(self, engine):
+        await engine.load_campaign({"12345678909": 0.0})
+        
+        assert await engine.best_counter_offer("12345678909", 10.0, 3) is None
+    
+    async def test_counter_offer_without_grid(self, engine):
+        assert await engine.best_counter_offer("12345678909", 10.0, 3) is None
\ No newline at end of file
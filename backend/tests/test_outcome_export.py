@@ -0,0 +1,171 @@
+"""
+Tests for the streaming outcome export encoders.
+"""
+
+import csv
+import io
+import json
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Outcome
+from backend.modules.analytics import outcome_export
+from backend.modules.analytics.outcome_export import (
+    EXPORT_FIELDS,
+    arrow_chunks,
+    csv_chunks,
+    export_outcomes,
+    ndjson_chunks,
+)
+
+
+def make_record(**overrides):
+    record = {
+        "id": uuid.UUID("00000000-0000-0000-0000-000000000001"),
+        "session_id": "session-1",
+        "debtor_cpf": "12345678909",
+        "outcome": "successful",
+        "agreed_amount": Decimal("1234.50"),
+        "discount_amount": Decimal("0.10"),
+        "payment_date": None,
+        "payment_slip_reference": None,
+        "interaction_timestamp": datetime(2025, 1, 10, 12, 0, tzinfo=timezone.utc),
+        "duration": 120,
+        "turns": 7,
+        "language": "pt-BR",
+    }
+    record.update(overrides)
+    return record
+
+
+async def chunked(*chunks):
+    for records in chunks:
+        yield records
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestNdjsonChunks:
+    """Tests for the NDJSON encoder."""
+    
+    async def test_one_line_per_record(self):
+        output = await collect(ndjson_chunks(chunked([make_record()], [make_record(turns=3)])))
+        
+        assert len(output) == 2
+        lines = b"".join(output).decode("utf-8").splitlines()
+        assert [json.loads(line)["turns"] for line in lines] == [7, 3]
+    
+    async def test_amounts_are_exact_strings(self):
+        output = await collect(ndjson_chunks(chunked([make_record()])))
+        
+        record = json.loads(output[0])
+        assert record["agreed_amount"] == "1234.50"
+        assert record["discount_amount"] == "0.10"
+        assert record["id"] == "00000000-0000-0000-0000-000000000001"
+        assert record["interaction_timestamp"] == "2025-01-10T12:00:00+00:00"
+
+
+class TestCsvChunks:
+    """Tests for the CSV encoder."""
+    
+    async def test_header_then_rows(self):
+        output = await collect(csv_chunks(chunked([make_record()], [make_record()])))
+        
+        assert len(output) == 2
+        rows = list(csv.DictReader(io.StringIO(b"".join(output).decode("utf-8"))))
+        assert len(rows) == 2
+        assert list(rows[0]) == EXPORT_FIELDS
+        assert rows[0]["agreed_amount"] == "1234.50"
+        assert rows[0]["payment_date"] == ""
+    
+    async def test_empty_export_has_header_only(self):
+        output = await collect(csv_chunks(chunked()))
+        
+        assert b"".join(output).decode("utf-8").splitlines() == [",".join(EXPORT_FIELDS)]
+
+
+class TestArrowChunks:
+    """Tests for the Arrow IPC encoder."""
+    
+    async def test_one_batch_per_chunk(self):
+        pa = pytest.importorskip("pyarrow")
+        
+        output = await collect(arrow_chunks(chunked([make_record()], [make_record(turns=3)])))
+        
+        reader = pa.ipc.open_stream(b"".join(output))
+        batches = list(reader)
+        assert [batch.num_rows for batch in batches] == [1, 1]
+        
+        table = pa.Table.from_batches(batches)
+        assert table.column_names == EXPORT_FIELDS
+        assert table.column("agreed_amount").to_pylist() == [Decimal("1234.50")] * 2
+        assert table.column("turns").to_pylist() == [7, 3]
+    
+    async def test_empty_export_is_a_valid_stream(self):
+        pa = pytest.importorskip("pyarrow")
+        
+        output = await collect(arrow_chunks(chunked()))
+        
+        table = pa.ipc.open_stream(b"".join(output)).read_all()
+        assert table.num_rows == 0
+        assert table.column_names == EXPORT_FIELDS
+
+
+@pytest.mark.database
+class TestExportOutcomes:
+    """End-to-end export through the server-side cursor."""
+    
+    @pytest.fixture
+    async def sessions(self, db_conn, monkeypatch):
+        factory = sessionmaker(
+            bind=db_conn, class_=AsyncSession, join_transaction_mode="create_savepoint"
+        )
+        monkeypatch.setattr(outcome_export, "AsyncSessionLocal", factory)
+        
+        # America/Sao_Paulo was UTC-2 (summer time) in January 2001
+        for session_id, hour in [
+            ("before", datetime(2001, 1, 10, 1, 0)),  # 9 January, 23:00 local
+            ("first", datetime(2001, 1, 10, 2, 0)),
+            ("second", datetime(2001, 1, 11, 12, 0)),
+            ("last", datetime(2001, 1, 12, 1, 59)),  # 11 January, 23:59 local
+            ("after", datetime(2001, 1, 12, 2, 0)),
+        ]:
+            await db_conn.execute(insert(Outcome).values(
+                session_id=session_id,
+                debtor_cpf="12345678909",
+                outcome="successful",
+                agreed_amount=Decimal("99.90"),
+                qualitative_notes="ok",
+                duration=60,
+                turns=5,
+                interaction_timestamp=hour.replace(tzinfo=timezone.utc),
+            ))
+        return factory
+    
+    async def test_exports_local_days_in_chunks(self, sessions):
+        output = await collect(
+            export_outcomes(date(2001, 1, 10), date(2001, 1, 11), "ndjson", chunk_size=2)
+        )
+        
+        # One encoded chunk per fetched partition of rows
+        assert len(output) == 2
+        records = [json.loads(line) for line in b"".join(output).decode("utf-8").splitlines()]
+        assert [record["session_id"] for record in records] == ["first", "second", "last"]
+        assert records[0]["agreed_amount"] == "99.90"
+    
+    async def test_csv_export_matches_ndjson(self, sessions):
+        output = await collect(
+            export_outcomes(date(2001, 1, 10), date(2001, 1, 11), "csv", chunk_size=2)
+        )
+        
+        rows = list(csv.DictReader(io.StringIO(b"".join(output).decode("utf-8"))))
+        assert [row["session_id"] for row in rows] == ["first", "second", "last"]
+        assert {row["agreed_amount"] for row in rows} == {"99.90"}
\ No newline at end of file
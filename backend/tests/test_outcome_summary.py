@@ -0,0 +1,181 @@
+"""
+Tests for the outcome daily summary triggers.
+
+These need a PostgreSQL database (see conftest.py). Everything happens in a
+transaction that is rolled back, apart from the concurrency test which cleans
+up after itself.
+"""
+
+import asyncio
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import delete, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import Outcome, OutcomeDailySummary
+from backend.models.partitioning import ensure_monthly_partitions
+from backend.modules.analytics.outcome_summary import outcome_summary_service
+
+pytestmark = pytest.mark.database
+
+# Days far in the past so existing data cannot interfere
+JANUARY = datetime(2001, 1, 10, 15, 0, tzinfo=timezone.utc)
+FEBRUARY = datetime(2001, 2, 10, 15, 0, tzinfo=timezone.utc)
+APRIL = datetime(2001, 4, 10, 15, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def conn(db_conn):
+    await ensure_monthly_partitions(db_conn, 1, today=JANUARY.date())
+    return db_conn
+
+
+async def add_outcome(conn, outcome, agreed_amount=None, turns=10, at=JANUARY):
+    result = await conn.execute(
+        insert(Outcome)
+        .values(
+            session_id="session-1",
+            debtor_cpf="12345678909",
+            outcome=outcome,
+            agreed_amount=agreed_amount,
+            qualitative_notes="ok",
+            duration=60,
+            turns=turns,
+            interaction_timestamp=at,
+        )
+        .returning(Outcome.id)
+    )
+    return result.scalar_one()
+
+
+async def summary(conn, day):
+    result = await conn.execute(
+        select(
+            OutcomeDailySummary.total_outcomes,
+            OutcomeDailySummary.successful,
+            OutcomeDailySummary.unsuccessful,
+            OutcomeDailySummary.agreements,
+            OutcomeDailySummary.recovered_amount,
+            OutcomeDailySummary.agreement_turns,
+        ).where(OutcomeDailySummary.day == day)
+    )
+    return tuple(result.one())
+
+
+class TestOutcomeDailySummaryTriggers:
+    """Tests for keeping the summary in sync with outcome changes."""
+    
+    async def test_insert_adds_to_day(self, conn):
+        await add_outcome(conn, "successful", Decimal("100.50"), turns=8)
+        await add_outcome(conn, "unsuccessful", turns=4)
+        
+        assert await summary(conn, date(2001, 1, 10)) == (2, 1, 1, 1, Decimal("100.50"), 8)
+    
+    async def test_update_replaces_old_values(self, conn):
+        outcome_id = await add_outcome(conn, "successful", Decimal("100.50"), turns=8)
+        
+        await conn.execute(
+            update(Outcome)
+            .where(Outcome.id == outcome_id)
+            .values(outcome="unsuccessful", agreed_amount=None)
+        )
+        
+        assert await summary(conn, date(2001, 1, 10)) == (1, 0, 1, 0, Decimal("0.00"), 0)
+    
+    async def test_update_moving_partition_moves_day(self, conn):
+        outcome_id = await add_outcome(conn, "successful", Decimal("100.50"), turns=8)
+        
+        await conn.execute(
+            update(Outcome)
+            .where(Outcome.id == outcome_id)
+            .values(interaction_timestamp=FEBRUARY)
+        )
+        
+        assert await summary(conn, date(2001, 1, 10)) == (0, 0, 0, 0, Decimal("0.00"), 0)
+        assert await summary(conn, date(2001, 2, 10)) == (1, 1, 0, 1, Decimal("100.50"), 8)
+    
+    async def test_delete_subtracts_from_day(self, conn):
+        outcome_id = await add_outcome(conn, "successful", Decimal("100.50"), turns=8)
+        await add_outcome(conn, "successful", Decimal("20.00"), turns=2)
+        
+        await conn.execute(delete(Outcome).where(Outcome.id == outcome_id))
+        
+        assert await summary(conn, date(2001, 1, 10)) == (1, 1, 0, 1, Decimal("20.00"), 2)
+    
+    async def test_new_partition_keeps_stranded_rows_counted(self, conn):
+        # No April partition yet: both rows land in the default partition
+        await add_outcome(conn, "successful", Decimal("100.50"), turns=8, at=APRIL)
+        await add_outcome(conn, "no_contact", at=APRIL)
+        
+        created = await ensure_monthly_partitions(conn, 0, today=APRIL.date())
+        
+        assert created == ["messages_2001_04", "outcomes_2001_04"]
+        assert await summary(conn, date(2001, 4, 10)) == (2, 1, 0, 1, Decimal("100.50"), 8)
+        moved = await conn.execute(text("SELECT count(*) FROM outcomes_2001_04"))
+        assert moved.scalar() == 2
+        stranded = await conn.execute(text(
+            "SELECT count(*) FROM outcomes_default "
+            "WHERE interaction_timestamp >= '2001-04-01' AND interaction_timestamp < '2001-05-01'"
+        ))
+        assert stranded.scalar() == 0
+
+
+class TestRebuildDailySummary:
+    """Tests for recomputing the summary from raw outcomes."""
+    
+    async def test_rebuild_replaces_drifted_rows(self, conn):
+        await add_outcome(conn, "successful", Decimal("100.50"), turns=8)
+        await add_outcome(conn, "unsuccessful", turns=4)
+        await conn.execute(update(OutcomeDailySummary).values(successful=99))
+        await conn.execute(insert(OutcomeDailySummary).values(
+            day=date(2001, 1, 11), total_outcomes=5
+        ))
+        session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+        
+        days = await outcome_summary_service.rebuild_daily_summary(
+            session, date(2001, 1, 10), date(2001, 1, 11)
+        )
+        
+        assert days == 1
+        assert await summary(conn, date(2001, 1, 10)) == (2, 1, 1, 1, Decimal("100.50"), 8)
+        daily = await outcome_summary_service.get_daily_summary(
+            session, date(2001, 1, 10), date(2001, 1, 11)
+        )
+        assert [entry["day"] for entry in daily] == [date(2001, 1, 10)]
+        assert daily[0]["recovered_amount"] == "100.50"
+        assert daily[0]["success_rate"] == 0.5
+        await session.close()
+    
+    async def test_concurrent_outcome_waits_for_rebuild(self, db_engine):
+        try:
+            async with db_engine.connect() as writer:
+                await writer.begin()
+                # The trigger upsert holds the summary row until commit
+                await add_outcome(writer, "successful", Decimal("10.00"), turns=2)
+                
+                async with AsyncSession(db_engine) as session:
+                    rebuild = asyncio.create_task(
+                        outcome_summary_service.rebuild_daily_summary(
+                            session, date(2001, 1, 10), date(2001, 1, 10)
+                        )
+                    )
+                    await asyncio.sleep(0.3)
+                    assert not rebuild.done()
+                    
+                    await writer.commit()
+                    assert await rebuild == 1
+            
+            async with db_engine.connect() as conn:
+                assert await summary(conn, date(2001, 1, 10)) == (
+                    1, 1, 0, 1, Decimal("10.00"), 2
+                )
+        finally:
+            async with db_engine.begin() as conn:
+                await conn.execute(delete(Outcome).where(
+                    Outcome.interaction_timestamp < datetime(2002, 1, 1, tzinfo=timezone.utc)
+                ))
+                await conn.execute(delete(OutcomeDailySummary).where(
+                    OutcomeDailySummary.day < date(2002, 1, 1)
+                ))
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Tests for time-range partition management.
+"""
+
+from datetime import date
+
+from backend.models.partitioning import (
+    PARTITIONED_TABLES,
+    ensure_monthly_partitions,
+    month_start,
+    partition_name,
+)
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+    
+    def scalar(self):
+        return self.value
+
+
+class FakeConnection:
+    """Records statements and answers existence checks from fixed sets."""
+    
+    def __init__(self, existing=(), stranded=()):
+        self.existing = set(existing)
+        self.stranded = set(stranded)
+        self.statements = []
+    
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        if "to_regclass" in sql:
+            return FakeResult(params["name"] in self.existing)
+        if sql.startswith("SELECT EXISTS"):
+            return FakeResult(any(f"FROM {table}_default" in sql for table in self.stranded))
+        return FakeResult(None)
+
+
+class TestMonthHelpers:
+    """Tests for month arithmetic and partition naming."""
+    
+    def test_month_start(self):
+        assert month_start(date(2025, 1, 31)) == date(2025, 1, 1)
+        assert month_start(date(2025, 12, 5), 1) == date(2026, 1, 1)
+        assert month_start(date(2025, 1, 15), -1) == date(2024, 12, 1)
+        assert month_start(date(2025, 3, 1), 14) == date(2026, 5, 1)
+    
+    def test_partition_name(self):
+        assert partition_name("messages", date(2025, 1, 1)) == "messages_2025_01"
+        assert partition_name("outcomes", date(2025, 11, 1)) == "outcomes_2025_11"
+
+
+class TestEnsureMonthlyPartitions:
+    """Tests for partition creation."""
+    
+    async def test_creates_missing_months_only(self):
+        conn = FakeConnection(existing={"messages_2025_01", "outcomes_2025_01"})
+        
+        created = await ensure_monthly_partitions(conn, 1, today=date(2025, 1, 20))
+        
+        assert created == ["messages_2025_02", "outcomes_2025_02"]
+        assert (
+            "CREATE TABLE messages_2025_02 PARTITION OF messages "
+            "FOR VALUES FROM ('2025-02-01') TO ('2025-03-01')"
+        ) in conn.statements
+        assert not any("DETACH" in sql for sql in conn.statements)
+    
+    async def test_moves_rows_out_of_non_empty_default(self):
+        conn = FakeConnection(stranded={"messages"})
+        
+        await ensure_monthly_partitions(conn, 0, today=date(2025, 1, 20))
+        
+        statements = [sql for sql in conn.statements if "messages" in sql]
+        steps = [
+            "CREATE TEMPORARY TABLE messages_2025_01_stranded (LIKE messages)",
+            "WITH moved AS (DELETE FROM messages_default",
+            "CREATE TABLE messages_2025_01 PARTITION OF messages",
+            "INSERT INTO messages SELECT * FROM messages_2025_01_stranded",
+            "DROP TABLE messages_2025_01_stranded",
+        ]
+        positions = [
+            next(i for i, sql in enumerate(statements) if sql.startswith(step))
+            for step in steps
+        ]
+        assert positions == sorted(positions)
+        # The default partition stays attached so row triggers keep firing
+        assert not any("DETACH" in sql for sql in conn.statements)
+    
+    async def test_every_partitioned_table_has_a_default(self):
+        conn = FakeConnection()
+        
+        await ensure_monthly_partitions(conn, 0, today=date(2025, 1, 20))
+        
+        for table in PARTITIONED_TABLES:
+            assert (
+                f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+            ) in conn.statements
\ No newline at end of file
@@ -5,7 +5,122 @@
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
 -- Create basic tables structure (will be managed by Alembic migrations later)
--- This is just to ensure the database is properly initialized
+-- Must be kept in sync with the SQLAlchemy models in backend/models
+
+-- Debtors
+CREATE TABLE IF NOT EXISTS debtors (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    cpf VARCHAR(11) NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    phone VARCHAR(20) NOT NULL,
+    email VARCHAR(255),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_debtors_cpf ON debtors (cpf);
+CREATE INDEX IF NOT EXISTS ix_debtors_phone ON debtors (phone);
+
+-- Debts
+CREATE TABLE IF NOT EXISTS debts (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    debtor_id UUID NOT NULL REFERENCES debtors (id) ON DELETE CASCADE,
+    original_amount NUMERIC(12, 2) NOT NULL,
+    current_amount NUMERIC(12, 2) NOT NULL,
+    due_date DATE NOT NULL,
+    days_past_due INTEGER NOT NULL DEFAULT 0,
+    debt_type VARCHAR(50) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'active',
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS ix_debts_debtor_id ON debts (debtor_id);
+
+-- Conversations
+CREATE TABLE IF NOT EXISTS conversations (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    session_id VARCHAR(64) NOT NULL UNIQUE,
+    debtor_id UUID REFERENCES debtors (id) ON DELETE SET NULL,
+    debt_id UUID REFERENCES debts (id) ON DELETE SET NULL,
+    phone VARCHAR(20) NOT NULL,
+    start_time TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    end_time TIMESTAMP WITH TIME ZONE,
+    status VARCHAR(20) NOT NULL DEFAULT 'active'
+);
+
+-- Covering index for "active conversation by phone" (index-only scans)
+CREATE INDEX IF NOT EXISTS ix_conversations_active_phone
+    ON conversations (phone)
+    INCLUDE (id, session_id, debtor_id, debt_id, start_time)
+    WHERE status = 'active';
+
+-- Closed conversations, scanned oldest first by the archival job
+CREATE INDEX IF NOT EXISTS ix_conversations_closed_end_time
+    ON conversations (end_time)
+    WHERE status <> 'active';
+
+-- Messages, range partitioned by month on created_at
+CREATE TABLE IF NOT EXISTS messages (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    conversation_id UUID NOT NULL REFERENCES conversations (id) ON DELETE CASCADE,
+    sender VARCHAR(10) NOT NULL,
+    content TEXT NOT NULL,
+    message_type VARCHAR(30) NOT NULL DEFAULT 'text',
+    metadata JSONB,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE INDEX IF NOT EXISTS ix_messages_conversation_created_at
+    ON messages (conversation_id, created_at);
+
+-- Outcomes, range partitioned by month on interaction_timestamp
+CREATE TABLE IF NOT EXISTS outcomes (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    interaction_timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    conversation_id UUID REFERENCES conversations (id) ON DELETE SET NULL,
+    session_id VARCHAR(64) NOT NULL,
+    debtor_cpf VARCHAR(11) NOT NULL,
+    outcome VARCHAR(30) NOT NULL,
+    agreed_amount NUMERIC(12, 2),
+    discount_amount NUMERIC(12, 2),
+    payment_date TIMESTAMP WITH TIME ZONE,
+    scheduled_payment_dates TIMESTAMP WITH TIME ZONE[] NOT NULL DEFAULT '{}',
+    payment_slip_reference VARCHAR(100),
+    qualitative_notes TEXT NOT NULL,
+    duration INTEGER NOT NULL,
+    turns INTEGER NOT NULL DEFAULT 0,
+    language VARCHAR(10) NOT NULL DEFAULT 'pt-BR',
+    PRIMARY KEY (id, interaction_timestamp)
+) PARTITION BY RANGE (interaction_timestamp);
+
+-- Covering index for "outcomes by day" reporting
+CREATE INDEX IF NOT EXISTS ix_outcomes_day
+    ON outcomes (interaction_timestamp)
+    INCLUDE (outcome, agreed_amount, discount_amount, duration, turns);
+CREATE INDEX IF NOT EXISTS ix_outcomes_session_id ON outcomes (session_id);
+
+-- Daily outcome aggregates for dashboards. The triggers maintaining them are
+-- installed by the application at startup (backend/models/outcome_summary.py)
+-- so the day buckets follow DEFAULT_TIMEZONE
+CREATE TABLE IF NOT EXISTS outcome_daily_summary (
+    day DATE PRIMARY KEY,
+    total_outcomes INTEGER NOT NULL DEFAULT 0,
+    successful INTEGER NOT NULL DEFAULT 0,
+    partially_successful INTEGER NOT NULL DEFAULT 0,
+    unsuccessful INTEGER NOT NULL DEFAULT 0,
+    no_contact INTEGER NOT NULL DEFAULT 0,
+    agreements INTEGER NOT NULL DEFAULT 0,
+    recovered_amount NUMERIC(14, 2) NOT NULL DEFAULT 0,
+    agreement_turns INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+);
+
+-- Default partitions only. Monthly partitions are created (and rows stranded in
+-- the default partitions moved into them) by the application at startup and
+-- periodically afterwards; see backend/models/partitioning.py
+CREATE TABLE IF NOT EXISTS messages_default PARTITION OF messages DEFAULT;
+CREATE TABLE IF NOT EXISTS outcomes_default PARTITION OF outcomes DEFAULT;
 
 -- Grant permissions
 GRANT ALL PRIVILEGES ON DATABASE certobot TO certobot_user;
\ No newline at end of file